@@ -1,7 +1,7 @@
 from flask import Flask
 from .core.core_init import CoreInitializer
 from .core.core_logging import logger
-from .extensions import db, migrate, login_manager, csrf
+from .extensions import db, migrate, login_manager, csrf, cache
 
 def register_cli_commands(app: Flask):
     """Register custom CLI commands for the Flask app."""
@@ -20,7 +20,7 @@ def create_app():
     app = Flask(__name__, instance_relative_config=True)
 
     # Initialize core services using your existing CoreInitializer structure
-    core_initializer = CoreInitializer(app, db, login_manager, migrate, csrf)
+    core_initializer = CoreInitializer(app, db, login_manager, migrate, csrf, cache)
     core_initializer.init_app()
 
     # --- Development-Only Auto-Login ---
@@ -35,6 +35,7 @@ class Config:
     UPLOAD_DIR = INSTANCE_PATH / 'uploads'
     EXPORT_DIR = INSTANCE_PATH / 'exports'
     SESSION_FILE_DIR = INSTANCE_PATH / 'sessions'
+    JINJA_CACHE_DIR = INSTANCE_PATH / 'jinja_cache'
     
     # Session configuration
     SESSION_TYPE = 'filesystem'
@@ -48,6 +49,7 @@ class Config:
     CACHE_DEFAULT_TIMEOUT = 300
     CACHE_KEY_PREFIX = 'rbm_cache:'
     REDIS_URL = os.environ.get('REDIS_URL')
+    CACHE_REDIS_URL = REDIS_URL
 
     # Logging configuration
     LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO').upper()
@@ -92,6 +94,18 @@ class ProductionConfig(Config):
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL')
     if not SQLALCHEMY_DATABASE_URI:
         raise ConfigurationError("DATABASE_URL must be set for production environment.")
+
+    # The pool is per process, and a request holds at most one connection, so a
+    # process never needs more than its thread count. Size it as
+    # DB_POOL_SIZE + DB_MAX_OVERFLOW >= threads per worker, and keep
+    # workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW) below PostgreSQL's max_connections
+    # (100 by default, minus a few for migrations and admin sessions).
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_size': int(os.environ.get('DB_POOL_SIZE', 5)),
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 10)),
+        'pool_pre_ping': True,
+        'pool_recycle': 1800,
+    }
     
     # Use Redis for caching in production
     CACHE_TYPE = 'RedisCache'
@@ -129,7 +129,13 @@ def register_error_handlers(app: Flask):
         err = NotFoundError('page', request.path)
         logger.warning(f"404 Not Found: {request.method} {request.path}")
         return err.to_response()
-    
+
+    @app.errorhandler(403)
+    def handle_403_error(error):
+        """Handle role checks that abort with 403 Forbidden."""
+        logger.warning(f"403 Forbidden: {request.method} {request.path}")
+        return AuthorizationError().to_response()
+
     @app.errorhandler(HTTPStatus.INTERNAL_SERVER_ERROR)
     @app.errorhandler(Exception)
     def handle_generic_error(error):
@@ -1,9 +1,11 @@
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence
 from enum import Enum
+import logging
 import threading
 from dataclasses import dataclass, field
 from datetime import datetime
 from functools import wraps
+from operator import itemgetter
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
 from flask import Flask
@@ -29,8 +31,9 @@ class EventHandler:
     """Manages event subscriptions and dispatching using a thread pool."""
     
     def __init__(self):
-        self._handlers: Dict[str, List[tuple[Callable, EventPriority]]] = {}
-        self._async_handlers: Dict[str, List[tuple[Callable, EventPriority]]] = {}
+        # Handlers are stored with the raw int priority so sorting never touches the Enum.
+        self._handlers: Dict[str, List[tuple[Callable, int]]] = {}
+        self._async_handlers: Dict[str, List[tuple[Callable, int]]] = {}
         self._lock = threading.Lock()
         self._executor: Optional[ThreadPoolExecutor] = None
         self.app: Optional[Flask] = None
@@ -54,17 +57,23 @@ class EventHandler:
             
             # Avoid duplicate subscriptions
             if any(h == handler for h, p in handlers_dict[event_name]):
-                logger.warning(f"Handler {handler.__name__} is already subscribed to event {event_name}.")
+                logger.warning("Handler %s is already subscribed to event %s.", handler.__name__, event_name)
                 return
 
-            handlers_dict[event_name].append((handler, priority))
+            handlers_dict[event_name].append((handler, int(priority.value)))
             # Sort handlers by priority (highest first)
-            handlers_dict[event_name].sort(key=lambda x: x[1].value, reverse=True)
-            logger.info(f"Handler '{handler.__name__}' subscribed to event '{event_name}' with priority {priority.name}.")
+            handlers_dict[event_name].sort(key=itemgetter(1), reverse=True)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Handler '%s' subscribed to event '%s' with priority %s.", handler.__name__, event_name, priority.name)
+
+    def has_subscribers(self, event_name: str) -> bool:
+        """Return True if any sync or async handler is subscribed to the event."""
+        return event_name in self._handlers or event_name in self._async_handlers
 
     def dispatch(self, event: Event):
         """Dispatch an event to all subscribed handlers."""
-        logger.debug(f"Dispatching event '{event.name}' with data: {event.data}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Dispatching event '%s' with data: %s", event.name, event.data)
         # Dispatch to sync handlers in the thread pool
         if event.name in self._handlers:
             for handler, _ in self._handlers[event.name]:
@@ -80,6 +89,42 @@ class EventHandler:
             # Fire and forget
             asyncio.ensure_future(run_async_handlers())
 
+    def dispatch_many(self, events: Sequence[Event]):
+        """
+        Dispatch a burst of events, submitting one executor job per handler
+        instead of one per (handler, event) pair.
+        """
+        sync_batches: Dict[Callable, List[Event]] = {}
+        async_pairs: List[tuple[Callable, Event]] = []
+        for event in events:
+            for handler, _ in self._handlers.get(event.name, ()):
+                sync_batches.setdefault(handler, []).append(event)
+            for handler, _ in self._async_handlers.get(event.name, ()):
+                async_pairs.append((handler, event))
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Dispatching batch of %d events to %d sync handlers.", len(events), len(sync_batches))
+
+        if self._executor and sync_batches:
+            submit = self._executor.submit
+            for handler, batch in sync_batches.items():
+                submit(self._run_batch, handler, batch)
+
+        if async_pairs:
+            async def run_async_handlers():
+                await asyncio.gather(*(handler(event) for handler, event in async_pairs), return_exceptions=True)
+
+            asyncio.ensure_future(run_async_handlers())
+
+    @staticmethod
+    def _run_batch(handler: Callable, events: List[Event]):
+        """Run a handler over a batch of events so one failure does not drop the rest."""
+        for event in events:
+            try:
+                handler(event)
+            except Exception:
+                logger.exception("Handler '%s' failed for event '%s'.", handler.__name__, event.name)
+
 # --- Global Instance and Decorators ---
 
 # Create a single instance to be imported and initialized in the app factory.
@@ -88,16 +133,19 @@ event_manager = EventHandler()
 def event_publisher(event_name: str, priority: EventPriority = EventPriority.NORMAL):
     """Decorator for automatically publishing an event after a function call."""
     def decorator(func):
+        source = func.__name__
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             result = func(*args, **kwargs)
-            event = Event(
-                name=event_name,
-                data={'result': result, 'args': args, 'kwargs': kwargs},
-                priority=priority,
-                source=func.__name__
-            )
-            event_manager.dispatch(event)
+            # Skip building the Event entirely when nobody is listening.
+            if event_manager.has_subscribers(event_name):
+                event_manager.dispatch(Event(
+                    name=event_name,
+                    data={'result': result, 'args': args, 'kwargs': kwargs},
+                    priority=priority,
+                    source=source
+                ))
             return result
         return wrapper
     return decorator
@@ -1,25 +1,24 @@
 import os
 from flask import Flask
 from pathlib import Path
+from jinja2 import FileSystemBytecodeCache
 
 from .core_config import config_dict
 from .core_logging import logger as core_logger
 from .core_security import security_manager
 from .core_errors import register_error_handlers
 from .core_events import event_manager
-# cache_manager is no longer used, so the import can be removed.
-# from .core_cache import cache_manager 
 
 class CoreInitializer:
     """Initializes the core components and extensions of the application."""
     
-    # Removed 'cache' from the __init__ method signature
-    def __init__(self, app: Flask, db, login_manager, migrate, csrf):
+    def __init__(self, app: Flask, db, login_manager, migrate, csrf, cache):
         self.app = app
         self.db = db
         self.login_manager = login_manager
         self.migrate = migrate
         self.csrf = csrf
+        self.cache = cache
 
     def init_app(self):
         """Run all initialization methods in the correct order."""
@@ -29,7 +28,8 @@ class CoreInitializer:
         self.init_database()
         self.init_security()
         self.init_csrf()
-        # self.init_cache() # Removed this call
+        self.init_cache()
+        self.init_templates()
         self.init_events()
         self.init_error_handlers()
 
@@ -60,8 +60,17 @@ class CoreInitializer:
         self.csrf.init_app(self.app)
         core_logger.app_logger.info("CSRF Protection Initialized.")
         
-    # The init_cache method is no longer needed.
-    # def init_cache(self): ...
+    def init_cache(self):
+        """Initialize Flask-Caching using the CACHE_* config values."""
+        self.cache.init_app(self.app)
+        core_logger.app_logger.info("Cache Initialized.")
+
+    def init_templates(self):
+        """Cache compiled Jinja templates on disk so fresh workers skip re-parsing them."""
+        cache_dir = self.app.config.get('JINJA_CACHE_DIR')
+        if cache_dir:
+            self.app.jinja_env.bytecode_cache = FileSystemBytecodeCache(str(cache_dir))
+            core_logger.app_logger.info("Template Bytecode Cache Initialized.")
 
     def init_events(self):
         """Initialize the event manager and load listeners."""
@@ -80,7 +89,8 @@ class CoreInitializer:
             self.app.config.get('LOG_DIR'),
             self.app.config.get('UPLOAD_DIR'),
             self.app.config.get('EXPORT_DIR'),
-            self.app.config.get('SESSION_FILE_DIR')
+            self.app.config.get('SESSION_FILE_DIR'),
+            self.app.config.get('JINJA_CACHE_DIR')
         ]
         for path in required_paths:
             if path:
@@ -1,33 +1,138 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from pathlib import Path
+import atexit
+import gzip
 import logging
 import logging.config
+import logging.handlers
 import json
+import os
+import queue
+import shutil
 import time
 import yaml
 from flask import request, has_request_context, Flask
 
+def _add_request_context(record: logging.LogRecord) -> None:
+    """Copy the current request's details onto a log record."""
+    if has_request_context():
+        req = request._get_current_object()
+        record.url, record.remote_addr, record.method, record.request_id = (
+            req.url, req.remote_addr, req.method, req.headers.get('X-Request-ID', '')
+        )
+    else:
+        record.url = record.remote_addr = record.method = record.request_id = None
+
 class RequestFormatter(logging.Formatter):
     """Custom formatter that adds request information to log records."""
     def format(self, record):
-        if has_request_context():
-            record.url = request.url
-            record.remote_addr = request.remote_addr
-            record.method = request.method
-            record.request_id = request.headers.get('X-Request-ID', '')
-        else:
-            record.url = None
-            record.remote_addr = None
-            record.method = None
-            record.request_id = None
+        # Records coming off the logging queue were already stamped in the request thread.
+        if not hasattr(record, 'request_id'):
+            _add_request_context(record)
         return super().format(record)
 
+class RequestContextFilter(logging.Filter):
+    """Stamps request details onto records before they leave the request thread."""
+    def filter(self, record):
+        _add_request_context(record)
+        return True
+
+def _gzip_namer(default_name: str) -> str:
+    return f"{default_name}.gz"
+
+def _gzip_rotator(source: str, dest: str) -> None:
+    """Compress a rotated log file instead of just renaming it."""
+    with open(source, 'rb') as src, gzip.open(dest, 'wb', compresslevel=6) as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(source)
+
+class BufferedTimedRotatingFileHandler(logging.handlers.TimedRotatingFileHandler):
+    """
+    TimedRotatingFileHandler that writes through a large stream buffer and only
+    flushes every `flush_records` records, every `flush_interval` seconds, or on ERROR.
+    Buffered records are written out on rollover and close. The interval is only
+    checked as records arrive; FlushingQueueListener covers idle periods.
+    """
+    def __init__(self, *args, buffer_size: int = 64 * 1024, flush_records: int = 512,
+                 flush_interval: float = 1.0, **kwargs):
+        self.buffer_size = buffer_size
+        self.flush_records = flush_records
+        self.flush_interval = flush_interval
+        self._pending = 0
+        self._force_flush = False
+        self._last_flush = time.monotonic()
+        super().__init__(*args, **kwargs)
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=self.errors)
+
+    def emit(self, record):
+        self._pending += 1
+        self._force_flush = record.levelno >= logging.ERROR
+        super().emit(record)
+
+    def flush(self):
+        # StreamHandler.emit calls flush() after every record; only hit the disk when due.
+        if (self._force_flush or self._pending >= self.flush_records
+                or time.monotonic() - self._last_flush >= self.flush_interval):
+            self.flush_now()
+
+    def flush_now(self):
+        """Write out any buffered records regardless of the thresholds."""
+        super().flush()
+        self._pending = 0
+        self._force_flush = False
+        self._last_flush = time.monotonic()
+
+class FlushingQueueListener(logging.handlers.QueueListener):
+    """
+    QueueListener that flushes its handlers whenever the queue has been idle for
+    `flush_interval` seconds, so buffered records reach disk after traffic stops.
+    """
+    def __init__(self, log_queue, *handlers, flush_interval: float = 1.0,
+                 respect_handler_level: bool = False):
+        super().__init__(log_queue, *handlers, respect_handler_level=respect_handler_level)
+        self.flush_interval = flush_interval
+
+    def _flush_handlers(self) -> None:
+        for handler in self.handlers:
+            getattr(handler, 'flush_now', handler.flush)()
+
+    def _monitor(self):
+        log_queue = self.queue
+        has_task_done = hasattr(log_queue, 'task_done')
+        pending = False
+        while True:
+            try:
+                record = log_queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                if pending:
+                    self._flush_handlers()
+                    pending = False
+                continue
+            if record is self._sentinel:
+                if has_task_done:
+                    log_queue.task_done()
+                break
+            self.handle(record)
+            pending = True
+            if has_task_done:
+                log_queue.task_done()
+        self._flush_handlers()
+
 class CoreLogger:
     """Centralized logging management for the application."""
     
     def __init__(self):
         self.app: Optional[Flask] = None
         self.loggers: Dict[str, logging.Logger] = {}
+        self._listeners: List[logging.handlers.QueueListener] = []
+        self._request_log_enabled = False
+        # Logger objects are singletons per name, so bind them once for the hot path.
+        self._app_logger = logging.getLogger('app')
+        self._request_logger = logging.getLogger('request')
+        atexit.register(self._stop_queue_listeners)
         self.default_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
     def init_app(self, app: Flask) -> None:
@@ -43,6 +148,7 @@ class CoreLogger:
         for logger_name in logging_config.get('loggers', {}):
             self.loggers[logger_name] = logging.getLogger(logger_name)
         
+        self._setup_queue_listeners([*self.loggers.values(), logging.getLogger()])
         self._setup_request_logging()
         self.app_logger.info("CoreLogger initialized successfully.")
 
@@ -84,12 +190,14 @@ class CoreLogger:
                     'level': 'ERROR'
                 },
                  'request_file': {
-                    'class': 'logging.handlers.TimedRotatingFileHandler',
+                    '()': BufferedTimedRotatingFileHandler,
                     'formatter': 'request',
                     'filename': log_dir / 'requests.log',
                     'when': 'midnight',
                     'interval': 1,
-                    'backupCount': 30
+                    'backupCount': 30,
+                    # Rotated request logs are high-volume text, so store them compressed.
+                    '.': {'namer': _gzip_namer, 'rotator': _gzip_rotator}
                 }
             },
             'loggers': {
@@ -113,26 +221,68 @@ class CoreLogger:
             }
         }
 
+    def _setup_queue_listeners(self, loggers: List[logging.Logger]) -> None:
+        """
+        Move file handlers behind a QueueHandler so request threads only enqueue
+        records and a background QueueListener does the disk I/O.
+        """
+        self._stop_queue_listeners()
+        for target_logger in loggers:
+            file_handlers = [h for h in target_logger.handlers if isinstance(h, logging.FileHandler)]
+            if not file_handlers:
+                continue
+
+            log_queue = queue.SimpleQueue()
+            queue_handler = logging.handlers.QueueHandler(log_queue)
+            queue_handler.addFilter(RequestContextFilter())
+            for handler in file_handlers:
+                target_logger.removeHandler(handler)
+            target_logger.addHandler(queue_handler)
+
+            flush_interval = min(getattr(h, 'flush_interval', 1.0) for h in file_handlers)
+            listener = FlushingQueueListener(log_queue, *file_handlers, flush_interval=flush_interval,
+                                             respect_handler_level=True)
+            listener.start()
+            self._listeners.append(listener)
+
+    def _stop_queue_listeners(self) -> None:
+        """Flush and stop any running queue listeners."""
+        while self._listeners:
+            self._listeners.pop().stop()
+
     def _setup_request_logging(self):
+        # Resolved once at startup; a runtime level change needs a re-init to take effect.
+        self._request_log_enabled = self.request_logger.isEnabledFor(logging.INFO)
+
         @self.app.before_request
         def before_request():
-            request.start_time = time.time()
+            if self._request_log_enabled:
+                request.start_time_ns = time.perf_counter_ns()
 
         @self.app.after_request
         def after_request(response):
-            if hasattr(request, 'start_time'):
-                duration_ms = (time.time() - request.start_time) * 1000
-                self.request_logger.info(f"{response.status} | {duration_ms:.2f}ms")
+            if self._request_log_enabled and hasattr(request, 'start_time_ns'):
+                duration_ms = (time.perf_counter_ns() - request.start_time_ns) / 1_000_000
+                self.request_logger.info("%s | %.2fms", response.status, duration_ms)
             return response
 
+    def isEnabledFor(self, level: int) -> bool:
+        return self.app_logger.isEnabledFor(level)
+
     def debug(self, msg, *args, **kwargs):
-        self.app_logger.debug(msg, *args, **kwargs)
+        app_logger = self.app_logger
+        if app_logger.isEnabledFor(logging.DEBUG):
+            app_logger.debug(msg, *args, **kwargs)
 
     def info(self, msg, *args, **kwargs):
-        self.app_logger.info(msg, *args, **kwargs)
+        app_logger = self.app_logger
+        if app_logger.isEnabledFor(logging.INFO):
+            app_logger.info(msg, *args, **kwargs)
 
     def warning(self, msg, *args, **kwargs):
-        self.app_logger.warning(msg, *args, **kwargs)
+        app_logger = self.app_logger
+        if app_logger.isEnabledFor(logging.WARNING):
+            app_logger.warning(msg, *args, **kwargs)
 
     def error(self, msg, *args, **kwargs):
         self.app_logger.error(msg, *args, **kwargs)
@@ -145,10 +295,10 @@ class CoreLogger:
 
     @property
     def app_logger(self) -> logging.Logger:
-        return self.loggers.get('app', logging.getLogger('app'))
+        return self._app_logger
 
     @property
     def request_logger(self) -> logging.Logger:
-        return self.loggers.get('request', logging.getLogger('request'))
+        return self._request_logger
 
 logger = CoreLogger()
\ No newline at end of file
@@ -1,23 +1,56 @@
+import heapq
+import threading
 import time
-from datetime import datetime, timedelta
+from collections import OrderedDict
 from flask import request, abort, current_app, g
 from werkzeug.security import generate_password_hash, check_password_hash
 import jwt
 from flask_login import LoginManager, current_user
 from functools import wraps
-import secrets
 
+from app.extensions import db
 from app.models import User
 from app.core.core_logging import logger
 
 login_manager = LoginManager()
 
+JWT_ALGORITHM = 'HS256'
+# Shared allow-list for decoding so verify_jwt does not build a new list per call.
+JWT_ALGORITHMS = (JWT_ALGORITHM,)
+
+# Static security headers applied to every response; built once at import.
+SECURITY_HEADERS = {
+    'X-Content-Type-Options': 'nosniff',
+    'X-Frame-Options': 'SAMEORIGIN',
+    'X-XSS-Protection': '1; mode=block',
+}
+# Only sent outside debug so local HTTP development is not pinned to HTTPS.
+HSTS_HEADERS = {
+    'Strict-Transport-Security': 'max-age=31536000; includeSubDomains',
+}
+
 class SecurityManager:
+    # Seconds between sweeps of expired IP blocks.
+    BLOCK_CLEANUP_INTERVAL = 30
+    JWT_LIFETIME_SECONDS = 24 * 60 * 60
+
     def __init__(self):
         self.app = None
         self.login_manager = login_manager
-        self.failed_logins = {}
+        # LRU-ordered so the least recently seen IPs are evicted once the cap is hit.
+        self.failed_logins = OrderedDict()
         self.blocked_ips = {}
+        # Min-heap of (expiry, ip) so expired blocks can be drained without a full scan.
+        self._block_heap = []
+        self._next_cleanup = 0.0
+        # Guards failed_logins, blocked_ips and the block heap across request threads.
+        self._lock = threading.Lock()
+        self._jwt = jwt.PyJWT()
+        self._jwt_key = None
+        self._max_login_attempts = 10
+        self._block_duration = 15 * 60
+        self._send_hsts = False
+        self._max_tracked_ips = 100_000
 
     def init_app(self, app):
         self.app = app
@@ -28,62 +61,99 @@ class SecurityManager:
         # It is essential for session management.
         @self.login_manager.user_loader
         def load_user(user_id):
-            return User.query.get(int(user_id))
+            return db.session.get(User, int(user_id))
             
         app.before_request(self.security_checks)
+        app.after_request(self.set_security_headers)
+
+        # Encode the signing key once instead of on every token operation.
+        self._jwt_key = app.config['SECRET_KEY'].encode()
+        self._max_login_attempts = app.config.get('SECURITY_MAX_LOGIN_ATTEMPTS', 10)
+        self._block_duration = app.config.get('SECURITY_BLOCK_DURATION_MINUTES', 15) * 60
+        self._send_hsts = not app.debug
+        self._max_tracked_ips = app.config.get('SECURITY_MAX_TRACKED_IPS', 100_000)
         
         logger.info("SecurityManager initialized.")
 
     def _track_failed_login(self, ip_address):
         """Track failed login attempts for an IP address."""
         now = time.time()
-        if ip_address not in self.failed_logins:
-            self.failed_logins[ip_address] = []
-        
-        block_duration = self.app.config.get('SECURITY_BLOCK_DURATION_MINUTES', 15) * 60
-        self.failed_logins[ip_address] = [t for t in self.failed_logins[ip_address] if now - t < block_duration]
-        
-        self.failed_logins[ip_address].append(now)
+        with self._lock:
+            # Each entry is a fixed-window counter: [attempts, window_start].
+            entry = self.failed_logins.get(ip_address)
+            if entry is None or now - entry[1] >= self._block_duration:
+                self.failed_logins[ip_address] = [1, now]
+            else:
+                entry[0] += 1
+            self.failed_logins.move_to_end(ip_address)
+
+            while len(self.failed_logins) > self._max_tracked_ips:
+                self.failed_logins.popitem(last=False)
 
     def security_checks(self):
         """Perform security checks on each request."""
+        # Fast path: nothing is blocked, so there is nothing to look up or clean.
+        if not self.blocked_ips:
+            return
+
         ip_address = request.remote_addr
-        
-        if ip_address in self.blocked_ips and time.time() < self.blocked_ips[ip_address]:
-            abort(429)
+        now = time.monotonic()
+        blocked_until = self.blocked_ips.get(ip_address)
+        if blocked_until is not None:
+            if now < blocked_until:
+                abort(429)
+            # The block has lapsed; expire it on access instead of waiting for the sweep.
+            with self._lock:
+                if self.blocked_ips.get(ip_address) == blocked_until:
+                    del self.blocked_ips[ip_address]
+
+        if now >= self._next_cleanup:
+            with self._lock:
+                self._cleanup_blocked_ips(now)
 
-        self._cleanup_blocked_ips()
+    def _block_ip(self, ip_address, duration):
+        """Block an IP address for `duration` seconds. Caller must hold self._lock."""
+        expiry = time.monotonic() + duration
+        self.blocked_ips[ip_address] = expiry
+        heapq.heappush(self._block_heap, (expiry, ip_address))
 
-    def _cleanup_blocked_ips(self):
-        """Periodically cleans up the blocked IPs dictionary."""
-        if secrets.randbelow(100) == 1:
-            now = time.time()
-            self.blocked_ips = {ip: expiry for ip, expiry in self.blocked_ips.items() if expiry > now}
+    def _cleanup_blocked_ips(self, now):
+        """Drop expired entries from the blocked IPs dictionary. Caller must hold self._lock."""
+        heap = self._block_heap
+        while heap and heap[0][0] <= now:
+            expiry, ip_address = heapq.heappop(heap)
+            # Only remove the entry if it has not been re-blocked with a later expiry.
+            if self.blocked_ips.get(ip_address) == expiry:
+                del self.blocked_ips[ip_address]
+        self._next_cleanup = now + self.BLOCK_CLEANUP_INTERVAL
 
     def check_rate_limit(self, ip_address):
         """Check if an IP has exceeded the login attempt limit."""
-        max_attempts = self.app.config.get('SECURITY_MAX_LOGIN_ATTEMPTS', 10)
-        if len(self.failed_logins.get(ip_address, [])) >= max_attempts:
-            block_duration = self.app.config.get('SECURITY_BLOCK_DURATION_MINUTES', 15) * 60
-            self.blocked_ips[ip_address] = time.time() + block_duration
-            logger.warning(f"IP address {ip_address} has been blocked for {block_duration/60} minutes.")
-            return True
-        return False
+        block_duration = self._block_duration
+        with self._lock:
+            entry = self.failed_logins.get(ip_address)
+            if (entry is None or entry[0] < self._max_login_attempts
+                    or time.time() - entry[1] >= block_duration):
+                return False
+            self._block_ip(ip_address, block_duration)
+        logger.warning(f"IP address {ip_address} has been blocked for {block_duration/60} minutes.")
+        return True
 
     def generate_jwt(self, user_id, **kwargs):
         """Generate a JSON Web Token."""
+        now = int(time.time())
         payload = {
-            'iat': datetime.utcnow(),
-            'exp': datetime.utcnow() + timedelta(days=1),
+            'iat': now,
+            'exp': now + self.JWT_LIFETIME_SECONDS,
             'sub': user_id,
         }
         payload.update(kwargs)
-        return jwt.encode(payload, self.app.config['SECRET_KEY'], algorithm='HS256')
+        return self._jwt.encode(payload, self._jwt_key, algorithm=JWT_ALGORITHM)
 
     def verify_jwt(self, token):
         """Verify a JSON Web Token."""
         try:
-            payload = jwt.decode(token, self.app.config['SECRET_KEY'], algorithms=['HS256'])
+            payload = self._jwt.decode(token, self._jwt_key, algorithms=JWT_ALGORITHMS)
             return payload
         except jwt.ExpiredSignatureError:
             return None
@@ -92,9 +162,9 @@ class SecurityManager:
 
     def set_security_headers(self, response):
         """Add security headers to the response."""
-        response.headers['X-Content-Type-Options'] = 'nosniff'
-        response.headers['X-Frame-Options'] = 'SAMEORIGIN'
-        response.headers['X-XSS-Protection'] = '1; mode=block'
+        response.headers.update(SECURITY_HEADERS)
+        if self._send_hsts:
+            response.headers.update(HSTS_HEADERS)
         return response
 
     @staticmethod
@@ -1,5 +1,5 @@
-from datetime import datetime, date
-from typing import Any, Dict, List, Optional, Union
+from datetime import date
+from typing import Any, Dict, Optional, Union
 import re
 import uuid
 import hashlib
@@ -7,6 +7,15 @@ from pathlib import Path
 import json
 from decimal import Decimal
 
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w\s.-]')
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+# Matches YYYY-MM-DD, DD-MM-YYYY, DD/MM/YYYY and YYYY/MM/DD (one separator style per date).
+_DATE_RE = re.compile(r'(\d{1,4})([-/])(\d{1,2})\2(\d{1,4})')
+_FILE_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+_EMPTY_VALUES = (None, "")
+# Quantize exponents for the common numbers of decimal places.
+_QUANTIZE_EXPONENTS = {places: Decimal(10) ** -places for places in range(9)}
+
 class DecimalEncoder(json.JSONEncoder):
     """Custom JSON encoder for handling Decimal types"""
     def default(self, obj):
@@ -24,12 +33,15 @@ def hash_file(file_path: Union[str, Path], chunk_size: int = 65536) -> str:
     Generate SHA-256 hash of a file
     Args:
         file_path: Path to the file
-        chunk_size: Size of chunks to read
+        chunk_size: Size of chunks to read (pre-3.11 fallback only)
     Returns:
         str: Hex digest of file hash
     """
-    sha256 = hashlib.sha256()
     with open(file_path, 'rb') as f:
+        # Python 3.11+ hashes the whole file inside C without a per-chunk Python loop.
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        sha256 = hashlib.sha256()
         while True:
             data = f.read(chunk_size)
             if not data:
@@ -48,7 +60,7 @@ def sanitize_filename(filename: str) -> str:
     # Remove path components
     filename = Path(filename).name
     # Replace potentially dangerous characters
-    filename = re.sub(r'[^\w\s.-]', '_', filename)
+    filename = _UNSAFE_FILENAME_RE.sub('_', filename)
     return filename.strip()
 
 def format_currency(amount: Union[float, Decimal], currency: str = "EUR") -> str:
@@ -74,19 +86,22 @@ def parse_date(date_str: str) -> Optional[date]:
     Returns:
         date: Parsed date object or None if invalid
     """
-    formats = [
-        "%Y-%m-%d",
-        "%d-%m-%Y",
-        "%d/%m/%Y",
-        "%Y/%m/%d"
-    ]
-    
-    for fmt in formats:
-        try:
-            return datetime.strptime(date_str, fmt).date()
-        except ValueError:
-            continue
-    return None
+    match = _DATE_RE.fullmatch(date_str)
+    if not match:
+        return None
+
+    first, _, month, last = match.groups()
+    if len(first) == 4 and len(last) <= 2:
+        year, day = first, last
+    elif len(last) == 4 and len(first) <= 2:
+        year, day = last, first
+    else:
+        return None
+
+    try:
+        return date(int(year), int(month), int(day))
+    except ValueError:
+        return None
 
 def calculate_percentage(value: Union[float, Decimal], total: Union[float, Decimal]) -> float:
     """
@@ -114,14 +129,21 @@ def flatten_dict(d: Dict[str, Any], parent_key: str = '', sep: str = '_') -> Dic
     Returns:
         Dict: Flattened dictionary
     """
-    items: List = []
-    for k, v in d.items():
-        new_key = f"{parent_key}{sep}{k}" if parent_key else k
-        if isinstance(v, dict):
-            items.extend(flatten_dict(v, new_key, sep).items())
+    flat: Dict[str, Any] = {}
+    # Explicit stack of item iterators: no recursion and no intermediate dicts,
+    # while keeping the same depth-first key order as a recursive walk.
+    stack = [(parent_key, iter(d.items()))]
+    while stack:
+        prefix, items = stack[-1]
+        for k, v in items:
+            new_key = f"{prefix}{sep}{k}" if prefix else k
+            if isinstance(v, dict):
+                stack.append((new_key, iter(v.items())))
+                break
+            flat[new_key] = v
         else:
-            items.append((new_key, v))
-    return dict(items)
+            stack.pop()
+    return flat
 
 def round_decimal(value: Union[float, Decimal], places: int = 2) -> Decimal:
     """
@@ -133,7 +155,12 @@ def round_decimal(value: Union[float, Decimal], places: int = 2) -> Decimal:
         Decimal: Rounded value
     """
     try:
-        return Decimal(str(value)).quantize(Decimal(10) ** -places)
+        exponent = _QUANTIZE_EXPONENTS.get(places)
+        if exponent is None:
+            exponent = Decimal(10) ** -places
+        if not isinstance(value, Decimal):
+            value = Decimal(str(value))
+        return value.quantize(exponent)
     except (TypeError, ValueError):
         return Decimal('0.00')
 
@@ -145,11 +172,11 @@ def format_file_size(size_bytes: int) -> str:
     Returns:
         str: Formatted size string
     """
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024:
-            return f"{size_bytes:.2f} {unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.2f} TB"
+    if size_bytes < 1024:
+        return f"{size_bytes:.2f} B"
+    # Each unit step is 2**10, so the bit length gives the unit index directly.
+    index = min((int(size_bytes).bit_length() - 1) // 10, len(_FILE_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * index)):.2f} {_FILE_SIZE_UNITS[index]}"
 
 def clean_dict(data: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -159,7 +186,7 @@ def clean_dict(data: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Dict: Cleaned dictionary
     """
-    return {k: v for k, v in data.items() if v is not None and v != ""}
+    return {k: v for k, v in data.items() if v not in _EMPTY_VALUES}
 
 def validate_email(email: str) -> bool:
     """
@@ -169,5 +196,4 @@ def validate_email(email: str) -> bool:
     Returns:
         bool: True if valid, False otherwise
     """
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
\ No newline at end of file
+    return _EMAIL_RE.match(email) is not None
\ No newline at end of file
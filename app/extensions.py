@@ -3,10 +3,12 @@ from flask_migrate import Migrate
 from flask_login import LoginManager
 from flask_security import Security
 from flask_wtf.csrf import CSRFProtect  # <-- Add this import
+from flask_caching import Cache
 
 # Other extensions
 db = SQLAlchemy()
 migrate = Migrate()
 login_manager = LoginManager()
 security = Security()
-csrf = CSRFProtect()  # <-- Add this line to create the csrf object
\ No newline at end of file
+csrf = CSRFProtect()  # <-- Add this line to create the csrf object
+cache = Cache()
\ No newline at end of file
@@ -10,12 +10,20 @@ from wtforms import (
     SubmitField
 )
 from wtforms.validators import DataRequired, Optional, NumberRange, Email
-from wtforms_sqlalchemy.fields import QuerySelectField
+from app.extensions import cache
 from app.models import Company, User
+from app.models.base_model import on_model_write
 
 
-def company_query():
-    return Company.query
+@cache.memoize(timeout=60)
+def company_choices():
+    """(id, name) pairs for company dropdowns, cached between form renders."""
+    rows = Company.query.with_entities(Company.id, Company.company_name).order_by(Company.company_name).all()
+    return [(row.id, row.company_name) for row in rows]
+
+@on_model_write(Company)
+def _invalidate_company_choices():
+    cache.delete_memoized(company_choices)
 
 class PumpUploadForm(FlaskForm):
     """Form for uploading pump data"""
@@ -71,9 +79,13 @@ class ContactForm(FlaskForm):
     email = StringField('Email Address', validators=[DataRequired(), Email()])
     phone = StringField('Phone Number', validators=[Optional()])
     position = StringField('Position/Title', validators=[Optional()])
-    company = QuerySelectField('Company', query_factory=company_query, get_label='company_name', allow_blank=True)
+    company_id = SelectField('Company', coerce=int, validators=[DataRequired()])
     submit = SubmitField('Save Contact')
 
+    def __init__(self, *args, **kwargs):
+        super(ContactForm, self).__init__(*args, **kwargs)
+        self.company_id.choices = company_choices()
+
 class DealOwnerForm(FlaskForm):
     """A simple form to create a new Deal Owner (User) for development."""
     username = StringField('Name', validators=[DataRequired()])
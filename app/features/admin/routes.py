@@ -1,15 +1,26 @@
-from flask import render_template, request, flash, redirect, url_for
+from flask import (render_template, request, flash, redirect, url_for,
+                   current_app, g, has_app_context, jsonify)
+from sqlalchemy import delete, event, insert, inspect as sa_inspect
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import MANYTOONE, raiseload
+from functools import lru_cache, partial
 from flask_login import login_required
 import secrets
-import string
+from types import MappingProxyType
+import time
+from werkzeug.datastructures import MultiDict
+from werkzeug.security import generate_password_hash
 
 from . import admin_bp
 from .forms import (CompanyForm, ContactForm, DealOwnerForm,
                     ManageInertiaBasesForm, ManageSeismicSpringsForm,
                     ManageRubberMountsForm, AdditionalPriceAdderForm)
-from app.models import (Company, Contact, User, InertiaBase, SeismicSpring, 
+from app.models import (Company, Contact, User, UserRole, InertiaBase, SeismicSpring, 
                         RubberMount, AdditionalPriceAdder, Deal, Pump)
+from app.models.base_model import notify_model_write, on_model_write
+from app.core.core_security import security_manager
 from app.core.core_logging import logger
+from app.extensions import db, cache
 
 # We are expanding the mapping to include more metadata for the front-end.
 # - display_name: A user-friendly name for the item.
@@ -59,41 +70,113 @@ ITEM_TYPE_MAPPING = {
     },
 }
 
+# Flash messages only depend on the display name, so build them once per item type.
+for _config in ITEM_TYPE_MAPPING.values():
+    _name = _config['display_name']
+    _config['messages'] = MappingProxyType({
+        'added': f'{_name} item added successfully!',
+        'add_failed': f'Error adding {_name} item.',
+        'updated': f'{_name} item updated successfully!',
+        'update_failed': f'Error updating {_name} item.',
+        'deleted': f'{_name} item deleted successfully!',
+        'not_found': f'{_name} item not found.',
+    })
+del _config, _name
+
+# The mapping is shared by every request thread; expose it read-only from here on.
+ITEM_TYPE_MAPPING = MappingProxyType({
+    key: MappingProxyType(config) for key, config in ITEM_TYPE_MAPPING.items()
+})
+
+# URL rule for the item type segment. Unknown types never match a route and get a
+# plain 404, so the views can index ITEM_TYPE_MAPPING directly.
+ITEM_TYPE_RULE = f"any({', '.join(ITEM_TYPE_MAPPING)})"
+
+def _table_cache_version(item_type):
+    """Version stamp for an item type's cached table fragments."""
+    return cache.get(f'admin_table_version:{item_type}') or 0
+
+def _invalidate_table_cache(item_type):
+    """Bump the version so every cached page of this item type's table is skipped."""
+    cache.set(f'admin_table_version:{item_type}', time.time_ns(), timeout=0)
+
+# Any committed write to a managed model retires its cached table pages, whether it
+# came from these views, another feature, an import or a model method.
+for _item_type, _config in ITEM_TYPE_MAPPING.items():
+    on_model_write(_config['model'])(partial(_invalidate_table_cache, _item_type))
+del _item_type, _config
+
+@lru_cache(maxsize=None)
+def _can_delete_by_statement(model_class):
+    """
+    True when deleting a row needs no ORM bookkeeping: the model only holds
+    many-to-one references, so there are no children to cascade to or nullify
+    and no association rows to clear.
+    """
+    return all(rel.direction is MANYTOONE for rel in sa_inspect(model_class).relationships)
+
+BULK_ADD_CHUNK_SIZE = 1000
+
+@lru_cache(maxsize=None)
+def _bulk_add_columns(model_class):
+    """Column keys a bulk_add row may set; keys, timestamps and credentials are set server-side."""
+    columns = {attr.key for attr in sa_inspect(model_class).column_attrs}
+    return frozenset(columns - {'id', 'created_at', 'updated_at', 'password_hash'})
+
+
+# --- Development query counter ---
+# In debug mode every admin request logs how many SQL statements it issued, so
+# N+1 regressions in the management views show up in the console straight away.
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def _count_admin_query(conn, cursor, statement, parameters, context, executemany):
+    if has_app_context() and 'admin_sql_count' in g:
+        g.admin_sql_count += 1
+
+@admin_bp.before_request
+def _start_query_count():
+    if current_app.debug:
+        g.admin_sql_count = 0
+        g.admin_sql_start = time.perf_counter()
+
+@admin_bp.after_request
+def _log_query_count(response):
+    if 'admin_sql_count' in g:
+        elapsed_ms = (time.perf_counter() - g.admin_sql_start) * 1000
+        logger.debug("%s n_queries=%d %.2fms", request.endpoint, g.admin_sql_count, elapsed_ms)
+    return response
+
+
 @admin_bp.route('/dashboard')
 def dashboard():
     # Pass the mapping to the template to generate links dynamically.
     return render_template('admin/dashboard.html', management_items=ITEM_TYPE_MAPPING)
 
 
-@admin_bp.route('/<item_type>/manage')
+@admin_bp.route(f'/<{ITEM_TYPE_RULE}:item_type>/manage')
 def manage_items(item_type):
-    if item_type not in ITEM_TYPE_MAPPING:
-        flash(f'Invalid item type: {item_type}', 'error')
-        return redirect(url_for('admin.dashboard'))
-
-    page = request.args.get('page', 1, type=int)
     config = ITEM_TYPE_MAPPING[item_type]
+    page = request.args.get('page', 1, type=int)
     model = config['model']
     
-    pagination = model.query.paginate(page=page, per_page=15, error_out=False)
+    # The table only renders column attributes, so any relationship access is an N+1 bug.
+    pagination = model.paginate_window(page, per_page=15, options=[raiseload('*')])
     items = pagination.items
-    
+
     # Pass the specific config for this item_type to the template
     return render_template(
         'admin/manage_base.html', 
         items=items, 
         item_type=item_type, 
         config=config, 
-        pagination=pagination
+        pagination=pagination,
+        # Fragment cache keys are joined as strings, so build the whole key here.
+        table_cache_key=f'{item_type}:{pagination.page}:{_table_cache_version(item_type)}'
     )
 
 
-@admin_bp.route('/<item_type>/add', methods=['GET', 'POST'])
+@admin_bp.route(f'/<{ITEM_TYPE_RULE}:item_type>/add', methods=['GET', 'POST'])
 def add_item(item_type):
-    if item_type not in ITEM_TYPE_MAPPING:
-        flash(f'Invalid item type: {item_type}', 'error')
-        return redirect(url_for('admin.dashboard'))
-    
     config = ITEM_TYPE_MAPPING[item_type]
     form_class = config.get('form')
     model_class = config['model']
@@ -114,34 +197,90 @@ def add_item(item_type):
                 new_item.username = form.username.data
                 new_item.email = form.email.data
                 new_item.phone_number = form.phone_number.data
-                alphabet = string.ascii_letters + string.digits
-                password = ''.join(secrets.choice(alphabet) for i in range(12))
-                new_item.set_password(password) # Using a method is better for hashing
-                flash(f'Deal Owner created. Temporary Password: {password}', 'info')
+                # 9 random bytes encode to exactly 12 URL-safe characters.
+                password = secrets.token_urlsafe(9)
+                new_item.password = password # The model's setter stores only the hash
             else:
                 form.populate_obj(new_item)
 
             new_item.save()
-            flash(f'{config["display_name"]} item added successfully!', 'success')
+            if item_type == 'deal_owner':
+                # Only announce the password once the account really exists.
+                flash(f'Deal Owner created. Temporary Password: {password}', 'info')
+            flash(config['messages']['added'], 'success')
             return redirect(url_for('admin.manage_items', item_type=item_type))
         except Exception as e:
             logger.error(f"--- DATABASE ERROR when adding {item_type}: {e} ---")
-            flash(f'Error adding {config["display_name"]} item.', 'error')
+            flash(config['messages']['add_failed'], 'error')
             
     return render_template('admin/create_generic.html', form=form, item_type=item_type, config=config)
 
 
-@admin_bp.route('/<item_type>/<int:item_id>/edit', methods=['GET', 'POST'])
+@admin_bp.route(f'/<{ITEM_TYPE_RULE}:item_type>/bulk_add', methods=['POST'])
+@login_required
+@security_manager.roles_required(UserRole.ADMIN.value)
+def bulk_add(item_type):
+    """API endpoint that inserts a JSON list of items in one transaction."""
+    config = ITEM_TYPE_MAPPING[item_type]
+    rows = request.get_json(silent=True)
+    if not isinstance(rows, list) or not rows or not all(isinstance(row, dict) for row in rows):
+        return jsonify({'success': False, 'message': 'Expected a non-empty JSON list of items.'}), 400
+
+    # Each row goes through the same form as add_item, so a row may only set the
+    # fields that form exposes and gets the same coercion and validation.
+    model_class = config['model']
+    columns = _bulk_add_columns(model_class)
+    values, errors = [], []
+    for index, row in enumerate(rows):
+        formdata = MultiDict({key: '' if value is None else str(value) for key, value in row.items()})
+        form = config['form'](formdata=formdata, meta={'csrf': False})
+        fields = {field.name for field in form} & columns
+        unknown = row.keys() - fields
+        if unknown:
+            errors.append({'row': index, 'errors': {name: ['Unknown field.'] for name in sorted(unknown)}})
+        elif not form.validate():
+            errors.append({'row': index, 'errors': form.errors})
+        else:
+            values.append({name: form[name].data for name in fields})
+    if errors:
+        return jsonify({'success': False, 'message': 'Some items are invalid.', 'errors': errors}), 400
+
+    passwords = {}
+    if model_class is User:
+        # Same rules as add_item: new deal owners are Sales users with a generated password.
+        # Hash before opening the transaction; the hashing is the slow part.
+        for row in values:
+            password = secrets.token_urlsafe(9)
+            row['role'] = UserRole.SALES
+            row['password_hash'] = generate_password_hash(password)
+            passwords[row['username']] = password
+
+    # executemany per chunk keeps the bind-parameter count of each statement bounded.
+    stmt = insert(model_class)
+    try:
+        for start in range(0, len(values), BULK_ADD_CHUNK_SIZE):
+            db.session.execute(stmt, values[start:start + BULK_ADD_CHUNK_SIZE])
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"--- DATABASE ERROR when bulk adding {item_type}: {e} ---")
+        return jsonify({'success': False, 'message': config['messages']['add_failed']}), 400
+
+    # A bulk insert fires no mapper events, so run the model's write hooks by hand.
+    notify_model_write(model_class)
+    response = {'success': True, 'message': f'{len(values)} {config["display_name"]} items added.'}
+    if passwords:
+        response['temporary_passwords'] = passwords
+    return jsonify(response)
+
+
+@admin_bp.route(f'/<{ITEM_TYPE_RULE}:item_type>/<int:item_id>/edit', methods=['GET', 'POST'])
 def edit_item(item_type, item_id):
-    if item_type not in ITEM_TYPE_MAPPING:
-        flash(f'Invalid item type: {item_type}', 'error')
-        return redirect(url_for('admin.manage_items', item_type=item_type))
-    
     config = ITEM_TYPE_MAPPING[item_type]
     model_class = config['model']
-    item = model_class.get_by_id(item_id)
+    item = db.session.get(model_class, item_id)
     if not item:
-        flash(f'{config["display_name"]} item not found.', 'error')
+        flash(config['messages']['not_found'], 'error')
         return redirect(url_for('admin.manage_items', item_type=item_type))
 
     form_class = config.get('form')
@@ -163,34 +302,48 @@ def edit_item(item_type, item_id):
                 form.populate_obj(item)
 
             item.save()
-            flash(f'{config["display_name"]} item updated successfully!', 'success')
+            flash(config['messages']['updated'], 'success')
             return redirect(url_for('admin.manage_items', item_type=item_type))
         except Exception as e:
             logger.error(f"--- DATABASE ERROR when editing {item_type}: {e} ---")
-            flash(f'Error updating {config["display_name"]} item.', 'error')
+            flash(config['messages']['update_failed'], 'error')
             
     return render_template('admin/create_generic.html', form=form, item_type=item_type, item_id=item_id, config=config)
 
 
-@admin_bp.route('/<item_type>/<int:item_id>/delete', methods=['POST'])
+@admin_bp.route(f'/<{ITEM_TYPE_RULE}:item_type>/<int:item_id>/delete', methods=['POST'])
 def delete_item(item_type, item_id):
-    if item_type not in ITEM_TYPE_MAPPING:
-        flash(f'Invalid item type: {item_type}', 'error')
-        return redirect(url_for('admin.dashboard'))
-
     config = ITEM_TYPE_MAPPING[item_type]
     model_class = config['model']
-    item = model_class.get_by_id(item_id)
+
+    if _can_delete_by_statement(model_class):
+        # Nothing to cascade, so delete by primary key without loading the row first.
+        try:
+            result = db.session.execute(delete(model_class).where(model_class.id == item_id))
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"--- DATABASE ERROR when deleting {item_type}: {e} ---")
+            flash(f'Error deleting item. It may be in use by another part of the application. ({e})', 'error')
+            return redirect(url_for('admin.manage_items', item_type=item_type))
+        if result.rowcount:
+            notify_model_write(model_class)
+            flash(config['messages']['deleted'], 'success')
+        else:
+            flash(config['messages']['not_found'], 'error')
+        return redirect(url_for('admin.manage_items', item_type=item_type))
+
+    item = db.session.get(model_class, item_id)
     
     if item:
         try:
             item.delete()
-            flash(f'{config["display_name"]} item deleted successfully!', 'success')
+            flash(config['messages']['deleted'], 'success')
         except Exception as e:
             logger.error(f"--- DATABASE ERROR when deleting {item_type}: {e} ---")
             # A common error is deleting an item that is linked by a foreign key
             flash(f'Error deleting item. It may be in use by another part of the application. ({e})', 'error')
     else:
-        flash(f'{config["display_name"]} item not found.', 'error')
+        flash(config['messages']['not_found'], 'error')
         
     return redirect(url_for('admin.manage_items', item_type=item_type))
\ No newline at end of file
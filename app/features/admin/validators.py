@@ -1,9 +1,14 @@
 from typing import List, Dict, Any, Optional
+from decimal import Decimal
 from wtforms.validators import ValidationError
 from app.core.core_errors import ValidationError as AppValidationError
+from app.extensions import db
 import re
 import os
 
+_PART_NUMBER_RE = re.compile(r'^[A-Z0-9-]+$')
+_SIZE_RE = re.compile(r'\d+\s*X\s*\d+\s*X\s*\d+', re.IGNORECASE)
+
 def validate_part_number(form: Any, field: Any) -> None:
     """
     Validate part number format
@@ -13,8 +18,10 @@ def validate_part_number(form: Any, field: Any) -> None:
     Raises:
         ValidationError: If part number format is invalid
     """
+    if not field.data:
+        return
     # Part numbers should be alphanumeric with optional hyphens
-    if not re.match(r'^[A-Z0-9-]+$', field.data):
+    if not _PART_NUMBER_RE.match(field.data):
         raise ValidationError('Part number must contain only uppercase letters, numbers, and hyphens')
 
 def validate_file_extension(filename: str, allowed_extensions: List[str]) -> None:
@@ -41,9 +48,11 @@ def validate_excel_content(file_data: bytes, required_columns: List[str]) -> Non
     """
     try:
         import pandas as pd
-        df = pd.read_excel(file_data)
+        # Only the header row is needed to check the columns
+        df = pd.read_excel(file_data, nrows=0)
         
-        missing_columns = [col for col in required_columns if col not in df.columns]
+        present_columns = set(df.columns)
+        missing_columns = [col for col in required_columns if col not in present_columns]
         if missing_columns:
             raise AppValidationError(f'Missing required columns: {", ".join(missing_columns)}')
             
@@ -59,10 +68,13 @@ def validate_price(form: Any, field: Any) -> None:
     Raises:
         ValidationError: If price is invalid
     """
+    if field.data is None:
+        return
     if field.data <= 0:
         raise ValidationError('Price must be greater than 0')
         
-    if len(str(field.data).split('.')[-1]) > 2:
+    price = field.data if isinstance(field.data, Decimal) else Decimal(str(field.data))
+    if price.as_tuple().exponent < -2:
         raise ValidationError('Price cannot have more than 2 decimal places')
 
 def validate_size_format(form: Any, field: Any) -> None:
@@ -74,7 +86,9 @@ def validate_size_format(form: Any, field: Any) -> None:
     Raises:
         ValidationError: If size format is invalid
     """
-    if not re.match(r'^\d+\s*X\s*\d+\s*X\s*\d+$', field.data.upper()):
+    if not field.data:
+        return
+    if not _SIZE_RE.fullmatch(field.data):
         raise ValidationError('Size must be in format: LENGTH X WIDTH X HEIGHT')
 
 def validate_load_capacity(form: Any, field: Any) -> None:
@@ -86,6 +100,8 @@ def validate_load_capacity(form: Any, field: Any) -> None:
     Raises:
         ValidationError: If load capacity is invalid
     """
+    if field.data is None:
+        return
     if field.data <= 0:
         raise ValidationError('Load capacity must be greater than 0')
     
@@ -119,7 +135,7 @@ def validate_unique_part_number(part_number: str, model: Any) -> None:
     Raises:
         AppValidationError: If part number is not unique
     """
-    if model.query.filter_by(part_number=part_number).first():
+    if db.session.query(model.query.filter_by(part_number=part_number).exists()).scalar():
         raise AppValidationError(f'Part number {part_number} already exists')
 
 def validate_weight_range(form: Any, field: Any) -> None:
@@ -131,6 +147,8 @@ def validate_weight_range(form: Any, field: Any) -> None:
     Raises:
         ValidationError: If weight is invalid
     """
+    if field.data is None:
+        return
     if field.data <= 0:
         raise ValidationError('Weight must be greater than 0')
     
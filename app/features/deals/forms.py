@@ -11,7 +11,25 @@ from wtforms import (
 from wtforms.validators import DataRequired, Optional, NumberRange, Length
 from .validators import unique_deal_name
 
+from app.extensions import cache
 from app.models import DealType, AustralianState, DealStage, User
+from app.models.base_model import on_model_write
+
+# Enum-backed choices never change at runtime, so build them once for every form.
+DEAL_TYPE_CHOICES = tuple((t.name, t.value) for t in DealType)
+STAGE_CHOICES = tuple((s.name, s.value) for s in DealStage)
+STATE_CHOICES = tuple((s.name, s.value) for s in AustralianState)
+
+
+@cache.memoize(timeout=30)
+def owner_choices():
+    """(id, username) pairs for the deal owner dropdown, cached between form renders."""
+    rows = User.query.with_entities(User.id, User.username).order_by(User.username).all()
+    return [(row.id, row.username) for row in rows]
+
+@on_model_write(User)
+def _invalidate_owner_choices():
+    cache.delete_memoized(owner_choices)
 
 class UpdateDealForm(FlaskForm):
     """Form for editing an existing deal's core details."""
@@ -22,17 +40,17 @@ class UpdateDealForm(FlaskForm):
     )
     deal_type = SelectField(
         'Category',
-        choices=[(t.name, t.value) for t in DealType],
+        choices=DEAL_TYPE_CHOICES,
         validators=[DataRequired()]
     )
     stage = SelectField(
         'Stage',
-        choices=[(s.name, s.value) for s in DealStage],
+        choices=STAGE_CHOICES,
         validators=[DataRequired()]
     )
     state = SelectField(
         'State',
-        choices=[(s.name, s.value) for s in AustralianState],
+        choices=STATE_CHOICES,
         validators=[DataRequired()]
     )
     owner_id = SelectField('Deal Owner', coerce=int, validators=[DataRequired()])
@@ -41,7 +59,7 @@ class UpdateDealForm(FlaskForm):
     def __init__(self, *args, **kwargs):
         super(UpdateDealForm, self).__init__(*args, **kwargs)
         # Populate owner choices dynamically
-        self.owner_id.choices = [(u.id, u.username) for u in User.query.order_by('username').all()]
+        self.owner_id.choices = owner_choices()
 
 
 class QuoteOptionForm(FlaskForm):
@@ -69,8 +87,8 @@ class DealForm(FlaskForm):
         'Deal Name',
         validators=[DataRequired(), unique_deal_name]
     )
-    deal_type = SelectField('Category', choices=[(t.name, t.value) for t in DealType])
-    state = SelectField('State', choices=[(s.name, s.value) for s in AustralianState])
+    deal_type = SelectField('Category', choices=DEAL_TYPE_CHOICES)
+    state = SelectField('State', choices=STATE_CHOICES)
     contact_id = IntegerField('Contact ID', validators=[Optional()])
     company_id = IntegerField('Company ID', validators=[Optional()])
     submit = SubmitField('Create Deal')
\ No newline at end of file
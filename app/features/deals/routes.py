@@ -2,74 +2,104 @@ from flask import (
     Blueprint, render_template, request, jsonify, redirect, url_for, flash, make_response, current_app
 )
 from collections import defaultdict
+from sqlalchemy import bindparam, update
+from sqlalchemy.orm import contains_eager, joinedload, selectinload
 from decimal import Decimal
 import asyncio
+import atexit
 import os
-from pyppeteer import launch
+import threading
+import time
 
 from app.models import (
     Deal, User, Quote, QuoteLineItem, DealStage, AustralianState, DealType,
     Company, Contact, QuoteRecipient, QuoteOption, Product
 )
+from app.models.base_model import on_model_write
 from .forms import DealForm, LineItemForm, QuoteOptionForm, UpdateDealForm
-from app.extensions import db
+from app.extensions import db, cache
 from app.core.core_logging import logger
 
 from . import deals_bp
 
+# Column order for the deals board.
+DEAL_STAGE_VALUES = tuple(stage.value for stage in DealStage)
+
+# Search autocomplete fires on every keystroke, so identical searches are served
+# from the cache. Any write to a searched model bumps the version in the key.
+SEARCH_CACHE_TIMEOUT = 60
+
+def _search_cache_key(*args, **kwargs):
+    version = cache.get('deals_search_version') or 0
+    return f'deals_search:{version}:{request.full_path}'
+
+@on_model_write(Company, Contact, Product)
+def _invalidate_search_cache():
+    cache.set('deals_search_version', time.time_ns(), timeout=0)
+
 def _clone_quote(source_quote, recipient, revision_number):
     """Creates a deep copy of a source quote for a given recipient."""
+    # Load the source options and all of their line items in two queries up front.
+    source_options = (
+        QuoteOption.query
+        .filter_by(quote_id=source_quote.id)
+        .options(selectinload(QuoteOption.line_items))
+        .order_by(QuoteOption.id)
+        .all()
+    )
+
+    # Build the whole tree before flushing so the unit of work batches the
+    # INSERTs per table, rather than flushing once per option.
     new_quote = Quote(
         recipient_id=recipient.id,
         revision=revision_number,
-        notes=source_quote.notes
+        notes=source_quote.notes,
+        options=[
+            QuoteOption(
+                name=source_option.name,
+                freight_charge=source_option.freight_charge,
+                line_items=[
+                    QuoteLineItem(
+                        product_id=source_item.product_id,
+                        notes=source_item.notes,
+                        quantity=source_item.quantity,
+                        unit_price=source_item.unit_price,
+                        discount=source_item.discount,
+                        display_order=source_item.display_order,
+                        custom_sku=source_item.custom_sku,
+                        custom_name=source_item.custom_name
+                    )
+                    for source_item in source_option.line_items
+                ]
+            )
+            for source_option in source_options
+        ]
     )
     db.session.add(new_quote)
     db.session.flush()
-
-    for source_option in source_quote.options:
-        new_option = QuoteOption(
-            quote_id=new_quote.id,
-            name=source_option.name,
-            freight_charge=source_option.freight_charge
-        )
-        db.session.add(new_option)
-        db.session.flush()
-
-        for source_item in source_option.line_items:
-            new_item = QuoteLineItem(
-                option_id=new_option.id,
-                product_id=source_item.product_id,
-                notes=source_item.notes,
-                quantity=source_item.quantity,
-                unit_price=source_item.unit_price,
-                discount=source_item.discount,
-                display_order=source_item.display_order,
-                custom_sku=source_item.custom_sku,
-                custom_name=source_item.custom_name
-            )
-            db.session.add(new_item)
     return new_quote
 
 @deals_bp.route('/', methods=['GET'])
 def list_deals():
     """Display a list of all deals, grouped by stage."""
     form = DealForm()
-    deals = Deal.query.order_by(Deal.created_at.desc()).all()
+    # Each deal card shows its owner, so load owners with the deals.
+    deals = Deal.query.options(joinedload(Deal.owner)).order_by(Deal.created_at.desc()).all()
 
     deals_by_stage = defaultdict(list)
     for deal in deals:
         deals_by_stage[deal.stage.value].append(deal)
 
+    total_deal_amount = sum(d.total_amount for d in deals if d.total_amount is not None)
     stats = {
-        'total_deal_amount': sum(d.total_amount for d in deals if d.total_amount is not None),
-        'avg_deal_amount': (sum(d.total_amount for d in deals if d.total_amount is not None) / len(deals)) if deals else 0,
+        'total_deal_amount': total_deal_amount,
+        'avg_deal_amount': (total_deal_amount / len(deals)) if deals else 0,
         'deal_count': len(deals)
     }
     return render_template(
         'deals/deals.html',
         deals_by_stage=deals_by_stage,
-        deal_stages=[stage.value for stage in DealStage],
+        deal_stages=DEAL_STAGE_VALUES,
         stats=stats,
         form=form
     )
@@ -77,7 +107,24 @@ def list_deals():
 @deals_bp.route('/<int:deal_id>')
 def deal_details(deal_id):
     """Display the details of a single deal."""
-    deal = Deal.query.get_or_404(deal_id)
+    # The page renders every recipient's quotes down to line item products, plus
+    # the deal's owner, contacts and companies; load it all up front.
+    deal = (
+        Deal.query
+        .options(
+            joinedload(Deal.owner),
+            selectinload(Deal.contacts).joinedload(Contact.company),
+            selectinload(Deal.companies),
+            selectinload(Deal.recipients).joinedload(QuoteRecipient.company),
+            selectinload(Deal.recipients)
+            .selectinload(QuoteRecipient.quotes)
+            .selectinload(Quote.options)
+            .selectinload(QuoteOption.line_items)
+            .joinedload(QuoteLineItem.product),
+        )
+        .filter_by(id=deal_id)
+        .first_or_404()
+    )
     all_quotes_in_deal = [q for r in deal.recipients for q in r.quotes]
 
     add_item_form = LineItemForm(notes="")
@@ -95,6 +142,7 @@ def deal_details(deal_id):
     )
 
 @deals_bp.route('/search/modal', methods=['GET'])
+@cache.cached(timeout=SEARCH_CACHE_TIMEOUT, make_cache_key=_search_cache_key)
 def search_for_modal():
     """
     Handles search requests from the deal creation modal for contacts and companies.
@@ -108,7 +156,7 @@ def search_for_modal():
 
     if search_type == 'contact':
         # Search for contacts by name or email
-        contacts = Contact.query.join(Company).filter(
+        contacts = Contact.query.join(Company).options(contains_eager(Contact.company)).filter(
             db.or_(
                 Contact.name.ilike(f'%{query}%'),
                 Contact.email.ilike(f'%{query}%')
@@ -154,12 +202,12 @@ def create_deal():
             
             # This logic remains the same
             if form.company_id.data:
-                company = Company.query.get(form.company_id.data)
+                company = db.session.get(Company, form.company_id.data)
                 if company:
                     new_deal.companies.append(company)
 
             if form.contact_id.data:
-                contact = Contact.query.get(form.contact_id.data)
+                contact = db.session.get(Contact, form.contact_id.data)
                 if contact:
                     new_deal.contacts.append(contact)
                     if contact.company and contact.company not in new_deal.companies:
@@ -195,7 +243,6 @@ def update_deal(deal_id):
     """Updates the core details of an existing deal."""
     deal = Deal.query.get_or_404(deal_id)
     form = UpdateDealForm(request.form, obj=deal)
-    form.owner_id.choices = [(u.id, u.username) for u in User.query.order_by('username').all()]
 
     if form.validate_on_submit():
         try:
@@ -344,6 +391,7 @@ def remove_party_from_deal(deal_id):
     return redirect(url_for('deals.deal_details', deal_id=deal_id))
 
 @deals_bp.route('/api/products/search', methods=['GET'])
+@cache.cached(timeout=SEARCH_CACHE_TIMEOUT, make_cache_key=_search_cache_key)
 def search_products():
     search_term = request.args.get('q', '', type=str)
     if not search_term or len(search_term) < 2:
@@ -413,10 +461,18 @@ def reorder_line_items(option_id):
     if not ordered_ids:
         return jsonify({'success': False, 'message': 'Missing order data.'}), 400
     try:
-        for index, item_id in enumerate(ordered_ids):
-            item = QuoteLineItem.query.filter_by(id=item_id, option_id=option.id).first()
-            if item:
-                item.display_order = index
+        # One executemany UPDATE; ids that belong to another option match no row.
+        line_items = QuoteLineItem.__table__
+        stmt = (
+            update(line_items)
+            .where(line_items.c.id == bindparam('item_id'))
+            .where(line_items.c.option_id == option.id)
+            .values(display_order=bindparam('new_order'))
+        )
+        db.session.execute(stmt, [
+            {'item_id': item_id, 'new_order': index}
+            for index, item_id in enumerate(ordered_ids)
+        ])
         db.session.commit()
         return jsonify({'success': True, 'message': 'Order updated.'})
     except Exception as e:
@@ -424,8 +480,48 @@ def reorder_line_items(option_id):
         logger.error(f"Error reordering line items for option {option_id}: {e}")
         return jsonify({'success': False, 'message': 'An error occurred.'}), 500
 
-async def _generate_pdf(html_content):
-    """Async helper function to launch browser and create PDF."""
+_static_css_cache = {}
+
+def _read_static_css(filename):
+    """
+    Returns the text of a file in static/css, read once per process. In debug
+    mode the file's mtime is checked so stylesheet edits show up without a restart.
+    """
+    path = os.path.join(current_app.static_folder, 'css', filename)
+    cached = _static_css_cache.get(path)
+    if cached is not None and not current_app.debug:
+        return cached[1]
+
+    mtime = os.stat(path).st_mtime_ns
+    if cached is None or cached[0] != mtime:
+        with open(path) as f:
+            cached = (mtime, f.read())
+        _static_css_cache[path] = cached
+    return cached[1]
+
+# --- PDF rendering ---
+# One headless Chrome is launched per process and kept alive on a dedicated event
+# loop thread; each export only opens and closes a page in it.
+
+PDF_RENDER_TIMEOUT = 60
+
+_pdf_loop = None
+_pdf_loop_lock = threading.Lock()
+_browser = None
+_browser_lock = None
+
+def _get_pdf_loop():
+    """Starts the renderer's event loop thread on first use and returns its loop."""
+    global _pdf_loop
+    with _pdf_loop_lock:
+        if _pdf_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name='pdf-renderer', daemon=True).start()
+            atexit.register(_close_browser)
+            _pdf_loop = loop
+    return _pdf_loop
+
+def _browser_launch_options():
     possible_paths = [
         r"C:\Program Files\Google\Chrome\Application\chrome.exe",
         r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe"
@@ -436,6 +532,8 @@ async def _generate_pdf(html_content):
         'handleSIGINT': False, 
         'handleSIGTERM': False, 
         'handleSIGHUP': False,
+        # pyppeteer's own atexit hook would run on a stopped loop; _close_browser shuts it down instead.
+        'autoClose': False,
         'args': ['--no-sandbox']
     }
 
@@ -444,18 +542,41 @@ async def _generate_pdf(html_content):
         launch_options['executablePath'] = chrome_path
     else:
         logger.error("Google Chrome not found. Attempting to use pyppeteer's downloaded Chromium.")
+    return launch_options
+
+async def _get_browser():
+    """Returns the shared browser, launching it again if it has exited. Runs on the renderer loop."""
+    global _browser, _browser_lock
+    # Imported here so workers that never export a PDF skip loading pyppeteer.
+    from pyppeteer import launch
+
+    if _browser_lock is None:
+        _browser_lock = asyncio.Lock()
+    async with _browser_lock:
+        if _browser is None or _browser.process.poll() is not None:
+            _browser = await launch(**_browser_launch_options())
+    return _browser
+
+def _close_browser():
+    if _browser is not None and _pdf_loop is not None:
+        try:
+            asyncio.run_coroutine_threadsafe(_browser.close(), _pdf_loop).result(timeout=10)
+        except Exception as e:
+            logger.error(f"Error closing PDF browser: {e}")
 
-    browser = await launch(**launch_options)
+async def _generate_pdf(html_content):
+    """Async helper function to render HTML to PDF in a new page of the shared browser."""
+    browser = await _get_browser()
     page = await browser.newPage()
-    # --- CORRECTED LINE: Removed extra arguments ---
-    await page.setContent(html_content)
-    pdf_data = await page.pdf({
-        'format': 'A4',
-        'printBackground': True,
-        'margin': {'top': '20px', 'right': '20px', 'bottom': '20px', 'left': '20px'}
-    })
-    await browser.close()
-    return pdf_data
+    try:
+        await page.setContent(html_content)
+        return await page.pdf({
+            'format': 'A4',
+            'printBackground': True,
+            'margin': {'top': '20px', 'right': '20px', 'bottom': '20px', 'left': '20px'}
+        })
+    finally:
+        await page.close()
 
 @deals_bp.route('/option/<int:option_id>/export/pdf', methods=['GET'])
 def export_quote_pdf(option_id):
@@ -475,9 +596,7 @@ def export_quote_pdf(option_id):
 
     # --- NEW: Read CSS file content to inline it ---
     try:
-        css_file_path = os.path.join(current_app.static_folder, 'css', 'quote_pdf.css')
-        with open(css_file_path) as f:
-            css_content = f.read()
+        css_content = _read_static_css('quote_pdf.css')
     except FileNotFoundError:
         logger.error("quote_pdf.css not found!")
         css_content = "" # Fail gracefully
@@ -492,7 +611,9 @@ def export_quote_pdf(option_id):
     )
     
     try:
-        pdf_file = asyncio.run(_generate_pdf(rendered_html))
+        pdf_file = asyncio.run_coroutine_threadsafe(
+            _generate_pdf(rendered_html), _get_pdf_loop()
+        ).result(timeout=PDF_RENDER_TIMEOUT)
     except Exception as e:
         logger.error(f"PDF Generation Error: {e}")
         flash('There was an error generating the PDF. Please check the logs.', 'error')
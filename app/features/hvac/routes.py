@@ -102,8 +102,8 @@ def add_assembly_to_option():
     if not data or 'assembly_id' not in data or 'option_id' not in data:
         return jsonify({'success': False, 'message': 'Invalid request.'}), 400
 
-    assembly = PumpAssembly.query.get(data['assembly_id'])
-    option = QuoteOption.query.get(data['option_id'])
+    assembly = db.session.get(PumpAssembly, data['assembly_id'])
+    option = db.session.get(QuoteOption, data['option_id'])
 
     if not assembly or not option:
         return jsonify({'success': False, 'message': 'Assembly or Option not found.'}), 404
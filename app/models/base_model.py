@@ -1,12 +1,81 @@
-from typing import Any, Dict, Optional
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Sequence
 from datetime import datetime, date
-from sqlalchemy import Column, Integer, DateTime
+from sqlalchemy import Column, Integer, DateTime, event, func, select
 from sqlalchemy.ext.declarative import declared_attr
+from sqlalchemy.orm import Session, object_session
+from flask_sqlalchemy.pagination import Pagination
 from decimal import Decimal
 
 from app.extensions import db # Corrected import
 from app.core.core_errors import ValidationError, DatabaseError
 
+
+class WindowPagination(Pagination):
+    """
+    Pagination that reads the total from a COUNT(*) OVER () column on the page
+    query itself, so a page costs one round trip instead of SELECT + COUNT.
+    """
+
+    def _query_items(self) -> list:
+        model = self._query_args["model"]
+        stmt = (
+            select(model, func.count().over().label("_total"))
+            .options(*self._query_args["options"])
+            .order_by(model.id)
+            .limit(self.per_page)
+            .offset(self._query_offset)
+        )
+        rows = db.session.execute(stmt).all()
+        self._window_total = rows[0]._total if rows else None
+        return [row[0] for row in rows]
+
+    def _query_count(self) -> int:
+        if self._window_total is not None:
+            return self._window_total
+        # Past the last page the window has no rows to ride on; count separately.
+        model = self._query_args["model"]
+        return db.session.execute(select(func.count()).select_from(model)).scalar()
+
+_write_hooks: Dict[type, List[Callable[[], None]]] = defaultdict(list)
+
+def _record_write(mapper, connection, target) -> None:
+    """Note the written model on its session; the hooks run once the transaction commits."""
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault('written_models', set()).add(mapper.class_)
+
+@event.listens_for(Session, 'after_commit')
+def _run_write_hooks(session) -> None:
+    notify_model_write(*session.info.pop('written_models', ()))
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_writes(session) -> None:
+    session.info.pop('written_models', None)
+
+def on_model_write(*models):
+    """
+    Register a no-argument callback to run after a commit that inserted, updated
+    or deleted rows of the given models. Running after the commit means a cache
+    rebuilt by a concurrent request cannot pick up uncommitted rows. ORM flushes
+    are tracked via mapper events; bulk statements bypass those, so their callers
+    run notify_model_write() once they have committed.
+    """
+    def decorator(fn):
+        for model in models:
+            _write_hooks[model].append(fn)
+            for identifier in ('after_insert', 'after_update', 'after_delete'):
+                if not event.contains(model, identifier, _record_write):
+                    event.listen(model, identifier, _record_write)
+        return fn
+    return decorator
+
+def notify_model_write(*models) -> None:
+    """Run the write hooks for the given models, each hook at most once."""
+    hooks = dict.fromkeys(fn for model in models for fn in _write_hooks.get(model, ()))
+    for fn in hooks:
+        fn()
+
 class BaseModel(db.Model):
     """
     Base model class providing common attributes and methods for all models.
@@ -81,7 +150,14 @@ class BaseModel(db.Model):
     @classmethod
     def get_by_id(cls, record_id: int) -> Optional['BaseModel']:
         """Get a model instance by its primary key."""
-        return cls.query.get(record_id)
+        return db.session.get(cls, record_id)
+
+    @classmethod
+    def paginate_window(cls, page: int, per_page: int, options: Sequence[Any] = (),
+                        error_out: bool = False) -> WindowPagination:
+        """Page through all rows ordered by id, fetching the total in the same query."""
+        return WindowPagination(page=page, per_page=per_page, error_out=error_out,
+                                model=cls, options=options)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert the model instance to a dictionary."""
@@ -4,11 +4,9 @@ Data export functionality.
 """
 
 from .excel_export import ExcelExporter
-from .pdf_export import PDFExporter
 from .report_generator import ReportGenerator
 
 __all__ = [
     'ExcelExporter',
-    'PDFExporter',
     'ReportGenerator',
 ]
\ No newline at end of file
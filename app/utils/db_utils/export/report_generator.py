@@ -4,7 +4,6 @@ import pandas as pd
 from io import BytesIO
 from app.core.core_database import DatabaseManager, DatabaseError
 from .excel_export import ExcelExporter
-from .pdf_export import PDFExporter
 from app.core.core_logging import logger # Use central app logger
 
 class ReportGenerator:
@@ -36,8 +35,7 @@ class ReportGenerator:
             if format == 'excel':
                 return ReportGenerator._generate_excel_sales_report(data, start_date, end_date)
             elif format == 'pdf':
-                # Assuming PDFExporter has a method for this kind of report
-                # This would need to be implemented in pdf_export.py
+                # There is no PDF exporter for tabular reports yet
                 raise NotImplementedError("PDF sales report is not yet implemented.")
             else:
                 raise ValueError(f"Unsupported format: {format}")
@@ -0,0 +1,52 @@
+"""Add trigram indexes for search
+
+Revision ID: 4108e674cfd0
+Revises: 0cf8002268a3
+Create Date: 2026-10-17 10:12:41.508317
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4108e674cfd0'
+down_revision = '0cf8002268a3'
+branch_labels = None
+depends_on = None
+
+
+# The search endpoints filter these columns with ILIKE '%term%'. A leading
+# wildcard cannot use a B-tree index, but a pg_trgm GIN index can.
+TRIGRAM_INDEXES = [
+    ('ix_companies_company_name_trgm', 'companies', 'company_name'),
+    ('ix_contacts_name_trgm', 'contacts', 'name'),
+    ('ix_contacts_email_trgm', 'contacts', 'email'),
+    ('ix_products_name_trgm', 'products', 'name'),
+    ('ix_products_sku_trgm', 'products', 'sku'),
+]
+
+
+def upgrade():
+    # pg_trgm is PostgreSQL-only; SQLite development databases keep scanning.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    # CONCURRENTLY avoids locking writes while the indexes build, but cannot
+    # run inside the migration transaction.
+    with op.get_context().autocommit_block():
+        for index_name, table_name, column_name in TRIGRAM_INDEXES:
+            op.execute(
+                f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} '
+                f'ON {table_name} USING gin ({column_name} gin_trgm_ops)'
+            )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    with op.get_context().autocommit_block():
+        for index_name, _, _ in TRIGRAM_INDEXES:
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {index_name}')
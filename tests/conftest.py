@@ -0,0 +1,26 @@
+import os
+
+import pytest
+
+# core_config builds every config class at import time, and ProductionConfig
+# refuses to load without DATABASE_URL; the tests themselves run on TestingConfig.
+os.environ.setdefault('FLASK_CONFIG', 'testing')
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+
+from app import create_app  # noqa: E402
+from app.extensions import db  # noqa: E402
+
+
+@pytest.fixture
+def app():
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
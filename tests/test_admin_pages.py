@@ -0,0 +1,38 @@
+from decimal import Decimal
+
+import pytest
+from flask import url_for
+
+from app.extensions import db
+from app.features.admin.routes import ITEM_TYPE_MAPPING
+from app.models import (AdditionalPriceAdder, Company, Contact, InertiaBase,
+                        RubberMount, SeismicSpring, User)
+
+
+@pytest.fixture
+def admin_rows(app):
+    """One row of every managed model, so each table renders its cells."""
+    company = Company(company_name='ACME Mechanical')
+    owner = User(username='owner', email='owner@example.com')
+    owner.password = 'secret'
+    db.session.add_all([
+        company,
+        Contact(name='Jane Smith', email='jane@example.com', company=company),
+        owner,
+        InertiaBase(model='IB-1'),
+        SeismicSpring(model='SS-1'),
+        RubberMount(model='RM-1'),
+        AdditionalPriceAdder(name='Drip tray', ip_adder=Decimal('1.00'), drip_tray_adder=Decimal('2.00')),
+    ])
+    db.session.commit()
+
+
+@pytest.mark.parametrize('item_type', list(ITEM_TYPE_MAPPING))
+def test_manage_page_renders(app, client, admin_rows, item_type):
+    with app.test_request_context():
+        url = url_for('admin.manage_items', item_type=item_type)
+
+    response = client.get(url)
+
+    assert response.status_code == 200
+    assert response.get_data(as_text=True).count('<tr>') >= 2
@@ -0,0 +1,44 @@
+from app.extensions import db
+from app.models import Company, Contact
+from app.models.base_model import _write_hooks, on_model_write
+
+
+def _register_recorder(*models):
+    calls = []
+
+    @on_model_write(*models)
+    def record():
+        calls.append(1)
+
+    return calls, record
+
+
+def _unregister(record, *models):
+    for model in models:
+        _write_hooks[model].remove(record)
+
+
+def test_hooks_run_once_after_commit(app):
+    calls, record = _register_recorder(Company, Contact)
+    try:
+        company = Company(company_name='ACME Mechanical')
+        db.session.add_all([company, Contact(name='Jane Smith', email='jane@example.com', company=company)])
+        db.session.flush()
+        assert calls == []
+
+        db.session.commit()
+        assert calls == [1]
+    finally:
+        _unregister(record, Company, Contact)
+
+
+def test_hooks_skip_rolled_back_writes(app):
+    calls, record = _register_recorder(Company)
+    try:
+        db.session.add(Company(company_name='ACME Mechanical'))
+        db.session.flush()
+        db.session.rollback()
+        db.session.commit()
+        assert calls == []
+    finally:
+        _unregister(record, Company)